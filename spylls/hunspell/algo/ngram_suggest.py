@@ -14,7 +14,7 @@ Scoring
 
 """
 
-from typing import Iterator, Tuple, List, Set, Dict
+from typing import Iterator, Iterable, Tuple, List, Set, Dict, Optional
 from operator import itemgetter
 import heapq
 
@@ -23,11 +23,12 @@ import spylls.hunspell.algo.string_metrics as sm
 
 
 MAX_ROOTS = 100
+MAX_ROOT_LENGTH_DIFF = 4
 MAX_GUESSES = 200
 
 
 def ngram_suggest(misspelling: str, *,
-                  dictionary_words: List[data.dic.Word],
+                  dictionary_words: Iterable[data.dic.Word],
                   prefixes: Dict[str, List[data.aff.Prefix]],
                   suffixes: Dict[str, List[data.aff.Suffix]],
                   known: Set[str], maxdiff: int, onlymaxdiff: bool = False) -> Iterator[str]:
@@ -48,41 +49,49 @@ def ngram_suggest(misspelling: str, *,
     Args:
         misspelling: Misspelled word
         dictionary_words: all entries from dictionary to iterate against (without forbidden, ``ONLYINCOMPOUND``
-                          and such)
-        prefixes: all prefixes from .aff file to try produce forms with
-        suffixes: all suffixes from .aff file to try produce forms with
+                          and such); only those with stem length close to misspelling's (see
+                          ``MAX_ROOT_LENGTH_DIFF``) are considered, so others might be omitted
+        prefixes: prefixes from .aff file to try produce forms with (by flag); it is enough to pass only
+                  those the misspelling starts with, others can't produce similar forms anyway
+        suffixes: suffixes from .aff file to try produce forms with (by flag); it is enough to pass only
+                  those the misspelling ends with
         maxdiff: contents of :attr:`Aff.MAXDIFF <spylls.hunspell.data.aff.Aff.MAXDIFF>` (changes amount of suggestions)
         onlymaxdiff: contents of :attr:`Aff.ONLYMAXDIFF <spylls.hunspell.data.aff.Aff.ONLYMAXDIFF>`
                      (exlcudes not very good suggestions, see :meth:`filter_guesses`)
     """
 
-    root_scores: List[Tuple[float, str, data.dic.Word]] = []
+    # Misspelling is scored against each of dictionary words (and then against their affixed forms),
+    # so we split it into n-grams just once. The longest n-grams needed are for :meth:`rough_affix_score`
+    # (n = length of the misspelling), the shortest misspellings still need 4-grams for :meth:`precise_affix_score`.
+    misspelling_ngrams = sm.ngrams(misspelling, max(len(misspelling), 4))
 
     # First, find MAX_ROOTS candidate dictionary entries, by calculating stem score against the
     # misspelled word.
-    for word in dictionary_words:
-        if abs(len(word.stem) - len(misspelling)) > 4:
-            continue
+    def scored_roots() -> Iterator[Tuple[float, str, data.dic.Word]]:
+        for word in dictionary_words:
+            if abs(len(word.stem) - len(misspelling)) > MAX_ROOT_LENGTH_DIFF:
+                continue
 
-        # TODO: hunspell has more exceptions/flag checks here (part of it we cover later in suggest,
-        # deciding, for example, if the suggestion is forbidden)
+            # TODO: hunspell has more exceptions/flag checks here (part of it we cover later in suggest,
+            # deciding, for example, if the suggestion is forbidden)
 
-        score = root_score(misspelling, word.stem)
+            score = root_score(misspelling, word.stem_lower, ngrams=misspelling_ngrams)
 
-        # If dictionary word have alternative spellings provided via `pp:` data tag, calculate
-        # score against them, too. Note that only simple ph:spelling are listed in alt_spellings,
-        # more complicated tags like ph:spellin* or ph:spellng->spelling are ignored in ngrams
-        if word.alt_spellings:
-            for variant in word.alt_spellings:
-                score = max(score, root_score(misspelling, variant))
+            # If dictionary word have alternative spellings provided via `pp:` data tag, calculate
+            # score against them, too. Note that only simple ph:spelling are listed in alt_spellings,
+            # more complicated tags like ph:spellin* or ph:spellng->spelling are ignored in ngrams
+            if word.alt_spellings:
+                for variant in word.alt_spellings:
+                    score = max(score, root_score(misspelling, variant.lower(), ngrams=misspelling_ngrams))
 
-        # Pythons stdlib heapq used to always keep only MAX_ROOTS of best results
-        if len(root_scores) > MAX_ROOTS:
-            heapq.heappushpop(root_scores, (score, word.stem, word))
-        else:
-            heapq.heappush(root_scores, (score, word.stem, word))
+            yield (score, word.stem, word)
 
-    roots = heapq.nlargest(MAX_ROOTS, root_scores)
+    # Scores for all the dictionary are produced as one stream, and Python's stdlib heapq chooses
+    # MAX_ROOTS best of them in one pass -- which is cheaper than pushing every score into our own heap,
+    # as the scores worse than the current MAX_ROOTS best are just skipped.
+    # Only score and stem are compared: homonyms (same stem, same score) are kept in dictionary order,
+    # and ``Word`` objects themselves aren't comparable.
+    roots = heapq.nlargest(MAX_ROOTS, scored_roots(), key=itemgetter(0, 1))
 
     # "Minimum passable" suggestion threshold (decided by replacing some chars in word with * and
     # calculating what score it would have).
@@ -99,14 +108,14 @@ def ngram_suggest(misspelling: str, *,
         if root.alt_spellings:
             # If any of alternative spelling passes the threshold
             for variant in root.alt_spellings:
-                score = rough_affix_score(misspelling, variant)
+                score = rough_affix_score(misspelling, variant, ngrams=misspelling_ngrams)
                 if score > threshold:
                     # ...we add them to the final suggestion list (but don't try to produce affix forms)
                     heapq.heappush(guess_scores, (score, variant, root.stem))
 
         # For all acceptable forms from current dictionary word (with all possible suffixes and prefixes)...
         for form in forms_for(root, prefixes, suffixes, similar_to=misspelling):
-            score = rough_affix_score(misspelling, form.lower())
+            score = rough_affix_score(misspelling, form.lower(), ngrams=misspelling_ngrams)
             if score > threshold:
                 # ...push them to final suggestion list if they pass the threshold
                 heapq.heappush(guess_scores, (score, form, form))
@@ -118,7 +127,7 @@ def ngram_suggest(misspelling: str, *,
 
     # Now, calculate more precise scores for all good suggestions
     guesses2 = [
-        (precise_affix_score(misspelling, compared.lower(), fact, base=score), real)
+        (precise_affix_score(misspelling, compared.lower(), fact, base=score, ngrams=misspelling_ngrams), real)
         for (score, compared, real) in guesses
     ]
 
@@ -135,23 +144,27 @@ def ngram_suggest(misspelling: str, *,
 # ------------------
 
 
-def root_score(word1: str, word2: str) -> float:
+def root_score(word1: str, word2: str, *, ngrams: Optional[List[List[str]]] = None) -> float:
     """
     Scoring, stage 1: Simple score for first dictionary words choosing: 3-gram score + longest start
     substring.
 
     Args:
         word1: misspelled word
-        word2: possible suggestion
+        word2: possible suggestion, lowercased (dictionary words have it pre-calculated as
+               :attr:`Word.stem_lower <spylls.hunspell.data.dic.Word.stem_lower>`)
+        ngrams: n-grams of ``word1`` (up to 3), pre-calculated with
+                :meth:`string_metrics.ngrams <spylls.hunspell.algo.string_metrics.ngrams>`, as the
+                same misspelling is scored against all dictionary words
     """
 
     return (
-        sm.ngram(3, word1, word2.lower(), longer_worse=True) +
-        sm.leftcommonsubstring(word1, word2.lower())
+        sm.ngram(3, word1, word2, longer_worse=True, s1_ngrams=ngrams) +
+        sm.leftcommonsubstring(word1, word2)
     )
 
 
-def rough_affix_score(word1: str, word2: str) -> float:
+def rough_affix_score(word1: str, word2: str, *, ngrams: Optional[List[List[str]]] = None) -> float:
     """
     Scoring, stage 2: First (rough and quick) score of affixed forms: n-gram score with n=length of
     the misspelled word + longest start substring
@@ -159,15 +172,17 @@ def rough_affix_score(word1: str, word2: str) -> float:
     Args:
         word1: misspelled word
         word2: possible suggestion
+        ngrams: pre-calculated n-grams of ``word1`` (up to its length), see :meth:`root_score`
     """
 
     return (
-        sm.ngram(len(word1), word1, word2, any_mismatch=True) +
+        sm.ngram(len(word1), word1, word2, any_mismatch=True, s1_ngrams=ngrams) +
         sm.leftcommonsubstring(word1, word2)
     )
 
 
-def precise_affix_score(word1: str, word2: str, diff_factor: float, *, base: float) -> float:
+def precise_affix_score(word1: str, word2: str, diff_factor: float, *,
+                        base: float, ngrams: Optional[List[List[str]]] = None) -> float:
     """
     Scoring, stage 3: Hardcore final score for affixed forms!
 
@@ -186,6 +201,7 @@ def precise_affix_score(word1: str, word2: str, diff_factor: float, *, base: flo
         word2: possible suggestion
         diff_factor: factor changing amount of suggestions (:attr:`Aff.MAXDIFF <spylls.hunspell.data.aff.Aff.MAXDIFF>`)
         base: initial score of word1 against word2
+        ngrams: pre-calculated n-grams of ``word1`` (up to 4), see :meth:`root_score`
     """
 
     lcs = sm.lcslen(word1, word2)
@@ -209,11 +225,11 @@ def precise_affix_score(word1: str, word2: str, diff_factor: float, *, base: flo
         result += 10
 
     # Add regular four-gram weight
-    result += sm.ngram(4, word1, word2, any_mismatch=True)
+    result += sm.ngram(4, word1, word2, any_mismatch=True, s1_ngrams=ngrams)
 
     # Sum of weighted bigrams used to estimate result quality
     bigrams = (
-        sm.ngram(2, word1, word2, any_mismatch=True, weighted=True) +
+        sm.ngram(2, word1, word2, any_mismatch=True, weighted=True, s1_ngrams=ngrams) +
         sm.ngram(2, word2, word1, any_mismatch=True, weighted=True)
     )
 
@@ -278,13 +294,13 @@ def forms_for(word: data.dic.Word, all_prefixes, all_suffixes, *, similar_to: st
         suffix
         for flag in word.flags
         for suffix in all_suffixes.get(flag, [])
-        if suffix.cond_regexp.search(word.stem) and similar_to.endswith(suffix.add)
+        if similar_to.endswith(suffix.add) and suffix.cond_regexp.search(word.stem)
     ]
     prefixes = [
         prefix
         for flag in word.flags
         for prefix in all_prefixes.get(flag, [])
-        if prefix.cond_regexp.search(word.stem) and similar_to.startswith(prefix.add)
+        if similar_to.startswith(prefix.add) and prefix.cond_regexp.search(word.stem)
     ]
 
     cross = [
@@ -3,7 +3,8 @@ Note: names of methods in this module, if seem weird, are the same as in Hunspel
 to keep track of them.
 """
 
-from typing import Iterator, Union, List, Set
+from collections import defaultdict
+from typing import Iterator, Union, List, Set, Dict, Sequence
 
 from spylls.hunspell.data import aff
 
@@ -107,12 +108,30 @@ def longswapchar(word: str) -> Iterator[str]:
             yield word[:first] + word[second] + word[first+1:second] + word[first] + word[second+1:]
 
 
-def badcharkey(word: str, layout: str) -> Iterator[str]:
+def keyboard_neighbours(layout: str) -> Dict[str, List[str]]:
+    """
+    Converts :attr:`aff.KEY <spylls.hunspell.data.aff.Aff.KEY>` (keyboard layout, like
+    ``qwertyuiop|asdfghjkl|zxcvbnm``) into the mapping of each char to the chars adjacent to it
+    on keyboard, in the order :meth:`badcharkey` should try them. It is calculated once per dictionary,
+    so ``badcharkey`` wouldn't need to search through the layout for each char of each misspelling.
+    """
+
+    neighbours: Dict[str, List[str]] = defaultdict(list)
+    for pos, c in enumerate(layout):
+        if pos > 0 and layout[pos-1] != '|':
+            neighbours[c].append(layout[pos-1])
+        if pos + 1 < len(layout) and layout[pos+1] != '|':
+            neighbours[c].append(layout[pos+1])
+
+    return dict(neighbours)
+
+
+def badcharkey(word: str, neighbours: Dict[str, List[str]]) -> Iterator[str]:
     """
     Produces permutations with chars replaced by adjacent chars on keyboard layout ("vat -> cat")
     or downcased (if it was accidental uppercase).
 
-    Uses :attr:`aff.KEY <spylls.hunspell.data.aff.Aff.KEY>`
+    Uses :attr:`aff.KEY <spylls.hunspell.data.aff.Aff.KEY>`, pre-processed with :meth:`keyboard_neighbours`
     """
 
     for i, c in enumerate(word):
@@ -121,16 +140,8 @@ def badcharkey(word: str, layout: str) -> Iterator[str]:
         if c != c.upper():
             yield before + c.upper() + after
 
-        if not layout:
-            continue
-
-        pos = layout.find(c)
-        while pos != -1:
-            if pos > 0 and layout[pos-1] != '|':
-                yield before + layout[pos-1] + after
-            if pos + 1 < len(layout) and layout[pos+1] != '|':
-                yield before + layout[pos+1] + after
-            pos = layout.find(c, pos+1)
+        for other in neighbours.get(c, ()):
+            yield before + other + after
 
 
 def extrachar(word: str) -> Iterator[str]:
@@ -144,13 +155,14 @@ def extrachar(word: str) -> Iterator[str]:
         yield word[:i] + word[i+1:]
 
 
-def forgotchar(word: str, trystring: str) -> Iterator[str]:
+def forgotchar(word: str, trystring: Sequence[str]) -> Iterator[str]:
     """
     Produces permutations with one char inserted in all possible possitions.
 
     List of chars is taken from :attr:`aff.TRY <spylls.hunspell.data.aff.Aff.TRY>` -- if it is absent,
     doesn't try anything! Chars there are expected to be sorted in order of chars usage in language
-    (most used characters first).
+    (most used characters first). Any sequence of chars is accepted, so the caller might pass TRY
+    with duplicates already removed.
     """
 
     if not trystring:
@@ -179,10 +191,10 @@ def movechar(word: str) -> Iterator[str]:
             yield word[:topos] + word[frompos] + word[topos:frompos] + word[frompos+1:]
 
 
-def badchar(word: str, trystring: str) -> Iterator[str]:
+def badchar(word: str, trystring: Sequence[str]) -> Iterator[str]:
     """
     Produces permutations with chars replaced by chars in :attr:`aff.TRY <spylls.hunspell.data.aff.Aff.TRY>`
-    set.
+    set (any sequence of chars, see :meth:`forgotchar`).
     """
 
     if not trystring:
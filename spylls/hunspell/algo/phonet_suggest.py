@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Iterator, List, Tuple
+from typing import Iterator, Iterable, Tuple
 from operator import itemgetter
 import heapq
 
@@ -10,9 +10,10 @@ import spylls.hunspell.algo.string_metrics as sm
 import spylls.hunspell.algo.ngram_suggest as ng
 
 MAX_ROOTS = 100
+MAX_ROOT_LENGTH_DIFF = 3
 
 
-def phonet_suggest(misspelling: str, *, dictionary_words: List[dic.Word], table: aff.PhonetTable) -> Iterator[str]:
+def phonet_suggest(misspelling: str, *, dictionary_words: Iterable[dic.Word], table: aff.PhonetTable) -> Iterator[str]:
     """
     Phonetical suggestion algorithm provides suggestions based on phonetical (prononication) similarity.
     It requires .aff file to define :attr:`PHONE <spylls.hunspell.data.aff.Aff.PHONE>` table --
@@ -32,14 +33,18 @@ def phonet_suggest(misspelling: str, *, dictionary_words: List[dic.Word], table:
 
     Args:
         misspelling: Misspelled word
-        dictionary_words: All words from dictionary (only stems are used)
+        dictionary_words: All words from dictionary (only stems are used); only those with stem length close
+                          to misspelling's (see ``MAX_ROOT_LENGTH_DIFF``) are considered, so others might be omitted
         table: Table for metaphone producing
     """
 
     misspelling = misspelling.lower()
     misspelling_ph = metaphone(table, misspelling)
 
-    scores: List[Tuple[float, str]] = []
+    # Both misspelling and its metaphone are compared with each dictionary word, so they are split
+    # into n-grams once
+    misspelling_ngrams = sm.ngrams(misspelling, 3)
+    misspelling_ph_ngrams = sm.ngrams(misspelling_ph, 3)
 
     # First, select words from dictionary whose stems alike the misspelling we are trying to suggest.
     #
@@ -50,29 +55,29 @@ def phonet_suggest(misspelling: str, *, dictionary_words: List[dic.Word], table:
     #
     # Considering extreme rarity of metaphone-enabled dictionaries, and "educational" goal of
     # spylls, we split it out.
-    for word in dictionary_words:
-        if abs(len(word.stem) - len(misspelling)) > 3:
-            continue
+    def scored_words() -> Iterator[Tuple[float, str]]:
+        for word in dictionary_words:
+            if abs(len(word.stem) - len(misspelling)) > MAX_ROOT_LENGTH_DIFF:
+                continue
 
-        # First, we calculate "regular" similarity score, just like in ngram_suggest
-        nscore = ng.root_score(misspelling, word.stem)
+            # First, we calculate "regular" similarity score, just like in ngram_suggest
+            nscore = ng.root_score(misspelling, word.stem_lower, ngrams=misspelling_ngrams)
 
-        if word.alt_spellings:
-            for variant in word.alt_spellings:
-                nscore = max(nscore, ng.root_score(misspelling, variant))
+            if word.alt_spellings:
+                for variant in word.alt_spellings:
+                    nscore = max(nscore, ng.root_score(misspelling, variant.lower(), ngrams=misspelling_ngrams))
 
-        if nscore <= 2:
-            continue
+            if nscore <= 2:
+                continue
 
-        # ...and if it shows words are somewhat close, we calculate metaphone score
-        score = 2 * sm.ngram(3, misspelling_ph, metaphone(table, word.stem), longer_worse=True)
+            # ...and if it shows words are somewhat close, we calculate metaphone score
+            score = 2 * sm.ngram(3, misspelling_ph, metaphone(table, word.stem), longer_worse=True,
+                                 s1_ngrams=misspelling_ph_ngrams)
 
-        if len(scores) > MAX_ROOTS:
-            heapq.heappushpop(scores, (score, word.stem))
-        else:
-            heapq.heappush(scores, (score, word.stem))
+            yield (score, word.stem)
 
-    guesses = heapq.nlargest(MAX_ROOTS, scores)
+    # ...and choose MAX_ROOTS best of them in one pass, see the same code in ngram_suggest
+    guesses = heapq.nlargest(MAX_ROOTS, scored_words())
 
     # Finally, we sort suggestions by simplistic string similarity metric (of the misspelling and
     # dictionary word's stem)
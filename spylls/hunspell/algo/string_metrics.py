@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Tuple, List, Dict, Optional
 
 
 def commoncharacterpositions(s1: str, s2: str) -> Tuple[int, bool]:
@@ -36,8 +36,19 @@ def leftcommonsubstring(s1: str, s2: str) -> int:
     return min(len(s1), len(s2))
 
 
+def ngrams(s: str, max_ngram_size: int) -> List[List[str]]:
+    """
+    All n-grams of the string up to the given size, grouped by size, e.g. ``ngrams("cats", 2)`` is
+    ``[["c", "a", "t", "s"], ["ca", "at", "ts"]]``. If one string is compared by :meth:`ngram` with
+    lots of others (like misspelling with all dictionary words), its n-grams might be calculated
+    once and passed to :meth:`ngram`.
+    """
+    return [[s[pos:pos+size] for pos in range(len(s) - size + 1)] for size in range(1, max_ngram_size + 1)]
+
+
 def ngram(max_ngram_size: int, s1: str, s2: str, *,
-          weighted: bool = False, any_mismatch: bool = False, longer_worse: bool = False) -> int:
+          weighted: bool = False, any_mismatch: bool = False, longer_worse: bool = False,
+          s1_ngrams: Optional[List[List[str]]] = None) -> int:
 
     """
     Calculates how many of n-grams of s1 are contained in s2 (the more the number, the more words
@@ -50,8 +61,9 @@ def ngram(max_ngram_size: int, s1: str, s2: str, *,
       weighted: substract from result for ngrams *not* contained
       longer_worse: add a penalty when second string is longer
       any_mismatch: add a penalty for any string length difference
+      s1_ngrams: n-grams of s1, pre-calculated with :meth:`ngrams` (at least up to ``max_ngram_size``)
 
-    FIXME: Actually, the last two settings do NOT participate in ngram counting by themselves, they
+    FIXME: Actually, longer_worse and any_mismatch do NOT participate in ngram counting by themselves, they
     are just adjusting the final score, but that's how it was structured in Hunspell.
     """
 
@@ -63,22 +75,35 @@ def ngram(max_ngram_size: int, s1: str, s2: str, *,
     nscore = 0
     # For all sizes of ngram up to desired...
     for ngram_size in range(1, max_ngram_size + 1):
+        if s1_ngrams is None:
+            grams = [s1[pos:pos+ngram_size] for pos in range(l1 - ngram_size + 1)]
+        else:
+            grams = s1_ngrams[ngram_size - 1]
         ns = 0
+        if not weighted:
+            # Simple (and the most frequently used) case: just count the ngrams of current size
+            # present in ANY place in second string
+            for gram in grams:
+                if gram in s2:
+                    ns += 1
+            nscore += ns
+            if ns < 2:
+                break
+            continue
+
         # Check every position in the first string
-        for pos in range(l1 - ngram_size + 1):
+        for pos, gram in enumerate(grams):
             # ...and if the ngram of current size in this position is present in ANY place in second string
-            if s1[pos:pos+ngram_size] in s2:
+            if gram in s2:
                 # increase score
                 ns += 1
-            elif weighted:
+            else:
                 # For "weighted" ngrams, decrease score if ngram is not found,
                 ns -= 1
                 if pos == 0 or pos + ngram_size == l1:
                     # ...and decrease once more if it was the beginning or end of first string
                     ns -= 1
         nscore += ns
-        if ns < 2 and not weighted:
-            break
 
     # longer_worse setting adds a penalty if the second string is longer than first
     if longer_worse:
@@ -94,22 +119,26 @@ def ngram(max_ngram_size: int, s1: str, s2: str, *,
 
 def lcslen(s1: str, s2: str) -> int:
     """
-    Classic "LCS (longest common subsequence) length" algorithm.
-    This implementation is stolen shamelessly from https://gist.github.com/cgt/c0c47c100efda1d11854
+    Classic "LCS (longest common subsequence) length" algorithm, in its bit-parallel form (Allison & Dix,
+    1986; Hyyrö, 2004): instead of filling the ``len(s1) x len(s2)`` table cell-by-cell, each column
+    of the table is represented by bits of one integer, and computed from the previous one with a
+    couple of arithmetic/bitwise operations. Python's integers are arbitrary-length, so there is no
+    limit on the strings' length. In the end, the LCS length is the number of zero bits in the last column.
     """
 
     m = len(s1)
-    n = len(s2)
+    if m == 0 or not s2:
+        return 0
 
-    c = [[0 for j in range(n+1)] for i in range(m+1)]
+    # For each char of s1, mask of positions where it is present
+    masks: Dict[str, int] = {}
+    for i, c in enumerate(s1):
+        masks[c] = masks.get(c, 0) | (1 << i)
 
-    for i in range(0, m):
-        for j in range(0, n):
-            if s1[i] == s2[j]:
-                c[i][j] = c[i-1][j-1] + 1
-            elif c[i-1][j] >= c[i][j-1]:
-                c[i][j] = c[i-1][j]
-            else:
-                c[i][j] = c[i][j-1]
+    full = (1 << m) - 1
+    row = full
+    for c in s2:
+        matches = row & masks.get(c, 0)
+        row = ((row + matches) | (row - matches)) & full
 
-    return c[m-1][n-1]
+    return m - bin(row).count('1')
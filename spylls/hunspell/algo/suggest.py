@@ -45,8 +45,9 @@ Suggestion classes
 
 """
 
-from typing import Iterator, List, Set, Union
+from typing import Iterator, List, Dict, Set, Tuple, Union
 
+from collections import defaultdict
 import dataclasses
 from dataclasses import dataclass
 
@@ -152,10 +153,50 @@ class Suggest:
         # even if it is the perfectly normal way to spell.
         self.use_dash = '-' in self.aff.TRY or 'a' in self.aff.TRY
 
-        # TODO: also NONGRAMSUGGEST and ONLYUPCASE
-        bad_flags = {*filter(None, [self.aff.FORBIDDENWORD, self.aff.NOSUGGEST, self.aff.ONLYINCOMPOUND])}
+        # TRY and KEY are iterated for each position of each misspelling, so we prepare them once:
+        # TRY chars are deduplicated (repeated chars would produce exactly the same permutations), but
+        # the order is preserved, as TRY is sorted by chars frequency; KEY layout is converted to
+        # "char => its keyboard neighbours" mapping.
+        self.try_chars = tuple(dict.fromkeys(self.aff.TRY))
+        self.key_neighbours = pmt.keyboard_neighbours(self.aff.KEY)
 
-        self.words_for_ngram = [word for word in self.dic.words if not bad_flags.intersection(word.flags)]
+        # TODO: also NONGRAMSUGGEST and ONLYUPCASE
+        self.bad_flags = frozenset(filter(None, [self.aff.FORBIDDENWORD, self.aff.NOSUGGEST, self.aff.ONLYINCOMPOUND]))
+
+        self.words_for_ngram = [word for word in self.dic.words if self.bad_flags.isdisjoint(word.flags)]
+
+        # Ngram-based and phonetical suggestions consider only words of length close to the misspelling's,
+        # so we group them by length, to not iterate through the whole dictionary (see
+        # :meth:`words_for_ngram_around`)
+        self.words_for_ngram_by_length: Dict[int, List[data.dic.Word]] = defaultdict(list)
+        for word in self.words_for_ngram:
+            self.words_for_ngram_by_length[len(word.stem)].append(word)
+
+        # Some flags are checked for every good suggestion (and its recapitalized variants) in the form
+        # "if ANY homonym in dictionary has this flag", so we calculate sets of such stems once:
+        def stems_with_flag(flag):
+            if not flag:
+                return frozenset()
+            return frozenset(word.stem for word in self.dic.words if flag in word.flags)
+
+        # ...the suggestion is considered forbidden if there is ANY homonym with flag FORBIDDENWORD
+        self.forbidden_words = stems_with_flag(self.aff.FORBIDDENWORD)
+        # ...and its case shouldn't be changed if there is ANY homonym with KEEPCASE flag
+        self.keepcase_words = stems_with_flag(self.aff.KEEPCASE)
+
+        # Most of the permutations are not words at all, but those which are, typically are just
+        # dictionary stems. If the stem has homonym which is allowed to be used on its own (without
+        # affixes, outside of compounds, in any case), and none of its homonyms is forbidden, Lookup
+        # would definitely consider it correct, so we can avoid full lookup (affixes, compounds etc.)
+        # for such suggestions. ICONV might change the word on lookup, so we don't trust stems then.
+        restricting_flags = self.bad_flags | frozenset(filter(None, [self.aff.KEEPCASE, self.aff.NEEDAFFIX]))
+        if self.aff.ICONV:
+            self.plain_stems = frozenset()
+        else:
+            self.plain_stems = frozenset(
+                word.stem for word in self.words_for_ngram
+                if restricting_flags.isdisjoint(word.flags) and word.stem not in self.forbidden_words
+            )
 
     def __call__(self, word: str) -> Iterator[str]:
         """
@@ -174,12 +215,18 @@ class Suggest:
             >>> [*suggester('badcat')]
             ['bad cat', 'bad-cat', 'baccarat']
 
-        Internally, the method just calls :meth:`suggest_internal` (which returns instances of :class:`Suggestion`)
+        If the word is correct by itself (and is not a ``NOSUGGEST`` one), nothing is suggested,
+        without running any of suggestion algorithms: they are much more expensive than one lookup.
+
+        Otherwise, the method just calls :meth:`suggest_internal` (which returns instances of :class:`Suggestion`)
         and yields suggestion texts.
 
         Args:
             word: Word to check
         """
+        if self.lookup(word, allow_nosuggest=False):
+            return
+
         yield from (suggestion.text for suggestion in self.suggest_internal(word))
 
     def suggest_internal(self, word: str) -> Iterator[Suggestion]:  # pylint: disable=too-many-statements
@@ -202,13 +249,29 @@ class Suggest:
         """
 
         # Whether some suggestion (permutation of the word) is an existing and allowed word,
-        # just delegates to Lookup
+        # just delegates to Lookup (unless it is one of the plain dictionary stems, see ``__init__``)
         def is_good_suggestion(word, capitalization=False, allow_break=True):
+            if word in self.plain_stems:
+                return True
             return self.lookup(word, allow_nosuggest=False, capitalization=capitalization, allow_break=allow_break)
 
+        # Different permutations (and permutations of different capitalization variants) frequently
+        # produce the same candidates: "swapchar" and "longswapchar" for short words, "badchar" and
+        # "badcharkey" replacing with the same char, and so on. The same candidate will be checked
+        # the same way, so we remember what was already checked and don't do it again.
+        checked: Set[Tuple] = set()
+
         # For some set of suggestions, produces only good ones:
         def filter_suggestions(suggestions):
             for suggestion in suggestions:
+                if isinstance(suggestion, MultiWordSuggestion):
+                    key = (tuple(suggestion.words), suggestion.allow_dash)
+                else:
+                    key = (suggestion.text, suggestion.allow_break)
+                if key in checked:
+                    continue
+                checked.add(key)
+
                 # For multiword suggestion,
                 if isinstance(suggestion, MultiWordSuggestion):
                     # ...if all of the words is correct
@@ -224,15 +287,17 @@ class Suggest:
                         yield suggestion
 
         # The suggestion is considered forbidden if there is ANY homonym in dictionary with flag
-        # FORBIDDENWORD. Besides marking swearing words, this feature also allows to include in
-        # dictionaries known "correctly-looking but actually non-existent" forms, which might important
-        # with very flexive languages.
+        # FORBIDDENWORD (see ``forbidden_words`` in ``__init__``). Besides marking swearing words, this
+        # feature also allows to include in dictionaries known "correctly-looking but actually non-existent"
+        # forms, which might important with very flexive languages.
         def is_forbidden(word):
-            return self.aff.FORBIDDENWORD and self.dic.has_flag(word, self.aff.FORBIDDENWORD)
+            return word in self.forbidden_words
 
         # This set will gather all good suggestions that were already returned (in order, for example,
         # to not return same suggestion twice)
         handled: Set[str] = set()
+        # ...and their lowercase forms, so inclusion checks below wouldn't lowercase them again and again
+        handled_lower: List[str] = []
 
         # Suggestions that are already considered good are passed through this method, which converts
         # it to proper capitalization form, and then either yields it (if it is not forbidden,
@@ -243,8 +308,7 @@ class Suggest:
             # If any of the homonyms has KEEPCASE flag, we shouldn't coerce it from the base form.
             # But CHECKSHARPS flag presence changes the meaning of KEEPCASE...
 
-            if (self.aff.KEEPCASE and self.dic.has_flag(text, self.aff.KEEPCASE) and not
-                    (self.aff.CHECKSHARPS and 'ß' in text)):
+            if text in self.keepcase_words and not (self.aff.CHECKSHARPS and 'ß' in text):
                 # Don't try to change text's case
                 pass
             else:
@@ -275,10 +339,12 @@ class Suggest:
             # seen ones: for examle, ngram-based suggestions might produce very similar forms, like
             # "impermanent" and "permanent" -- both of them are correct, but if the first is
             # closer (by length/content) to misspelling, there is no point in suggesting the second
-            if check_inclusion and any(previous.lower() in text.lower() for previous in handled):
+            text_lower = text.lower()
+            if check_inclusion and any(previous in text_lower for previous in handled_lower):
                 return
 
             handled.add(text)
+            handled_lower.append(text_lower)
             # Finally, OCONV table in .aff-file might specify what chars to replace in suggestions
             # (for example, "'" to proper typographic "’", or common digraphs)
             text = self.aff.OCONV(text) if self.aff.OCONV else text
@@ -450,7 +516,7 @@ class Suggest:
 
         # Try to replace chars by those close on keyboard ("wueue" -> "queue"), KEY in aff file specifies
         # keyboard layout.
-        for suggestion in pmt.badcharkey(word, self.aff.KEY):
+        for suggestion in pmt.badcharkey(word, self.key_neighbours):
             yield Suggestion(suggestion, 'badcharkey')
 
         # Try remove character (produces all forms with one char removed: "clat" => "lat", "cat", "clt", "cla")
@@ -459,7 +525,7 @@ class Suggest:
 
         # Try insert character (from set of all possible language chars specified in aff), produces
         # all forms with any of the TRY chars inserted in all possible positions
-        for suggestion in pmt.forgotchar(word, self.aff.TRY):
+        for suggestion in pmt.forgotchar(word, self.try_chars):
             yield Suggestion(suggestion, 'forgotchar')
 
         # Try to move a character forward and backwars:
@@ -470,7 +536,7 @@ class Suggest:
             yield Suggestion(suggestion, 'movechar')
 
         # Try replace each character with any of other language characters
-        for suggestion in pmt.badchar(word, self.aff.TRY):
+        for suggestion in pmt.badchar(word, self.try_chars):
             yield Suggestion(suggestion, 'badchar')
 
         # Try fix two-character doubling: "chickcken" -> "chicken" (one-character doubling is
@@ -501,10 +567,23 @@ class Suggest:
         if self.aff.MAXNGRAMSUGS == 0:
             return
 
+        misspelling = word.lower()
+
+        # Only affixes that the misspelling might have (it starts or ends with affix's text) are useful
+        # for producing forms similar to it. Prefixes and (reversed) suffixes are stored in tries
+        # (the same that are used by Lookup), so we can select all of them in one pass.
+        prefixes = defaultdict(list)
+        for prefix in self.aff.prefixes_index.lookup(misspelling):
+            prefixes[prefix.flag].append(prefix)
+
+        suffixes = defaultdict(list)
+        for suffix in self.aff.suffixes_index.lookup(misspelling[::-1]):
+            suffixes[suffix.flag].append(suffix)
+
         yield from ngram_suggest.ngram_suggest(
-                    word.lower(),
-                    dictionary_words=self.words_for_ngram,
-                    prefixes=self.aff.PFX, suffixes=self.aff.SFX,
+                    misspelling,
+                    dictionary_words=self.words_for_ngram_around(misspelling, ngram_suggest.MAX_ROOT_LENGTH_DIFF),
+                    prefixes=prefixes, suffixes=suffixes,
                     known={*(word.lower() for word in handled)},
                     maxdiff=self.aff.MAXDIFF,
                     onlymaxdiff=self.aff.ONLYMAXDIFF)
@@ -523,4 +602,19 @@ class Suggest:
         if not self.aff.PHONE:
             return
 
-        yield from phonet_suggest.phonet_suggest(word, dictionary_words=self.words_for_ngram, table=self.aff.PHONE)
+        yield from phonet_suggest.phonet_suggest(
+                    word,
+                    dictionary_words=self.words_for_ngram_around(word.lower(), phonet_suggest.MAX_ROOT_LENGTH_DIFF),
+                    table=self.aff.PHONE)
+
+    def words_for_ngram_around(self, word: str, max_diff: int) -> Iterator[data.dic.Word]:
+        """
+        Dictionary words suitable for ngram-based and phonetical suggestions, with stem length differing
+        from the ``word``'s by no more than ``max_diff``.
+
+        Args:
+            word: Misspelled word
+            max_diff: Maximum length difference
+        """
+        for length in range(len(word) - max_diff, len(word) + max_diff + 1):
+            yield from self.words_for_ngram_by_length.get(length, [])
@@ -34,8 +34,8 @@ list, and also provides some indexes and utilities for convenience.
 """
 
 from collections import defaultdict
-from dataclasses import dataclass
-from typing import List, Set, Dict
+from dataclasses import dataclass, field
+from typing import List, FrozenSet, Dict
 
 from spylls.hunspell.algo.capitalization import Type as CapType
 
@@ -97,14 +97,15 @@ class Word:
 
     .. autoattribute:: alt_spellings
     .. autoattribute:: captype
+    .. autoattribute:: stem_lower
     """
 
     #: Word stem
     stem: str
     #: Flags of the word, parsed depending on aff-file settings. ``ABCD`` might be parsed
     #: into ``{"A", "B", "C", "D"}`` (default flag format, "short"), or ``{"AB", "CD"}``
-    #: ("long" flag format)
-    flags: Set[str]
+    #: ("long" flag format). Flags never change after reading, so they are stored as ``frozenset``.
+    flags: FrozenSet[str]
     #: Raw values of data tags. Each tag can be repeated several times, like ``witch ph:wich ph:which``,
     #: that's why dictionary values are lists
     data: Dict[str, List[str]]
@@ -116,6 +117,15 @@ class Word:
     #: One of :class:`capitalization.Type <spylls.hunspell.algo.capitalization.Type>` (no capitalization,
     #: initial letter capitalized, all letters, or mixed) analyzed on dictionary reading, will be useful on lookup.
     captype: CapType
+    #: Simple lowercase form of the stem (just ``str.lower()``, unlike casing-aware lowercasing used
+    #: by lookup). Used by :mod:`ngram_suggest <spylls.hunspell.algo.ngram_suggest>`, which compares
+    #: misspelling to every word in dictionary. For stems that are already lowercase, it is the same
+    #: string object.
+    stem_lower: str = field(init=False)
+
+    def __post_init__(self):
+        lower = self.stem.lower()
+        self.stem_lower = self.stem if lower == self.stem else lower
 
     def __repr__(self):
         return f"Word({self.stem} /{','.join(self.flags)})"
@@ -119,7 +119,7 @@ def read_dic(source: BaseReader, *, aff: Aff, context: Context) -> dic.Dic:
         # And here we are!
         word_obj = dic.Word(
             stem=word,
-            flags={*context.parse_flags(flags)},
+            flags=frozenset(context.parse_flags(flags)),
             data=data,
             captype=captype,
             alt_spellings=alt_spellings